@@ -0,0 +1,72 @@
+"""
+Benchmark check_data_quality against parse_transactions + validate_and_filter
+
+Usage: python benchmarks/bench_data_quality.py [rows]
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_quality import check_data_quality
+from utils.file_handler import parse_transactions, validate_and_filter
+
+
+def make_lines(rows, invalid_share=0.1, seed=1):
+    """
+    Builds synthetic raw lines, about invalid_share of them rejected
+    """
+    rng = random.Random(seed)
+    regions = ['North', 'South', 'East', 'West']
+    broken = [
+        lambda line: line.replace('|T', '|X', 1) if line.startswith('T') else 'X' + line[1:],
+        lambda line: line.rsplit('|', 1)[0],
+        lambda line: line.replace('|C', '|', 1)
+    ]
+    lines = []
+
+    for i in range(rows):
+        line = (
+            f"T{i}|2024-12-{rng.randrange(1, 31):02d}|P{rng.randrange(101, 111)}|"
+            f"Product {rng.randrange(10)}|{rng.randrange(1, 10)}|"
+            f"{rng.randrange(100, 5000):,}|C{rng.randrange(5000)}|{rng.choice(regions)}"
+        )
+        if rng.random() < invalid_share:
+            line = rng.choice(broken)(line)
+        lines.append(line)
+
+    return lines
+
+
+def best_of(func, repeat=3):
+    """
+    Best wall-clock time of several runs
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def old_path(lines):
+    with contextlib.redirect_stdout(io.StringIO()):
+        validate_and_filter(parse_transactions(lines))
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+
+    lines = make_lines(rows)
+    print(f"{rows} rows")
+
+    old = best_of(lambda: old_path(lines))
+    new = best_of(lambda: check_data_quality(lines))
+    print(f"parse_transactions + validate_and_filter: {old:.2f}s")
+    print(f"check_data_quality:                       {new:.2f}s  ({old / new:.2f}x)")
@@ -0,0 +1,116 @@
+"""
+Benchmark the float and exact (integer paise) money paths
+
+Usage: python benchmarks/bench_money.py [rows]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_quality import check_data_quality
+from utils.file_handler import parse_transactions
+from utils.data_processor import (
+    calculate_total_revenue,
+    region_wise_sales,
+    top_selling_products,
+    customer_analysis,
+    daily_sales_trend
+)
+
+
+def make_lines(rows, seed=1):
+    """
+    Builds synthetic raw sales lines with prices in rupees and paise
+    """
+    rng = random.Random(seed)
+    regions = ['North', 'South', 'East', 'West']
+    lines = []
+
+    for i in range(rows):
+        price = rng.randrange(100, 500000)
+        lines.append(
+            f"T{i}|2024-12-{rng.randrange(1, 31):02d}|P{rng.randrange(101, 111)}|"
+            f"Product {rng.randrange(10)}|{rng.randrange(1, 10)}|"
+            f"{price // 100:,}.{price % 100:02d}|C{rng.randrange(5000)}|{rng.choice(regions)}"
+        )
+
+    return lines
+
+
+def baseline_parse(raw_lines):
+    """
+    The float-only row parser used before exact money mode, for comparison
+    """
+    transactions = []
+
+    for line in raw_lines:
+        parts = line.split('|')
+        if len(parts) != 8:
+            continue
+
+        tid, date, pid, pname, qty, price, cid, region = parts
+
+        try:
+            qty = int(qty.replace(',', ''))
+            price = float(price.replace(',', ''))
+        except ValueError:
+            continue
+
+        transactions.append({
+            'TransactionID': tid,
+            'Date': date,
+            'ProductID': pid,
+            'ProductName': pname.replace(',', ''),
+            'Quantity': qty,
+            'UnitPrice': price,
+            'CustomerID': cid,
+            'Region': region
+        })
+
+    return transactions
+
+
+def run_aggregators(transactions, exact):
+    calculate_total_revenue(transactions, exact=exact)
+    region_wise_sales(transactions, exact=exact)
+    top_selling_products(transactions, exact=exact)
+    customer_analysis(transactions, exact=exact)
+    daily_sales_trend(transactions, exact=exact)
+
+
+def best_of(func, repeat=3):
+    """
+    Best wall-clock time of several runs
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    lines = make_lines(rows)
+    print(f"{rows} rows")
+
+    baseline = best_of(lambda: baseline_parse(lines))
+    parse = best_of(lambda: parse_transactions(lines))
+    quality = best_of(lambda: check_data_quality(lines))
+    print(f"parse baseline (float): {baseline:.2f}s")
+    print(f"parse (float + paise):  {parse:.2f}s  ({parse / baseline:.2f}x baseline time)")
+    print(f"check_data_quality:     {quality:.2f}s")
+
+    transactions, _ = check_data_quality(lines)
+    float_time = best_of(lambda: run_aggregators(transactions, False))
+    exact_time = best_of(lambda: run_aggregators(transactions, True))
+    print(f"aggregators float:      {float_time:.2f}s")
+    print(f"aggregators exact:      {exact_time:.2f}s  ({float_time / exact_time:.2f}x float throughput)")
+    print(f"total float:  {calculate_total_revenue(transactions):,.2f}")
+    print(f"total exact:  {calculate_total_revenue(transactions, exact=True):,.2f}")
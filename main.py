@@ -1,9 +1,10 @@
 from utils.file_handler import (
     read_sales_data,
-    parse_transactions,
     validate_and_filter
 )
 
+from utils.data_quality import check_data_quality
+
 from utils.data_processor import (
     calculate_total_revenue,
     region_wise_sales,
@@ -48,9 +49,19 @@ def main():
 
         # -------------------------------------------------
         # [2/10] Parse and clean data
+        # Every rule is evaluated once here, so invalid rows are not
+        # re-checked by the validate_and_filter calls below
         print("\n[2/10] Parsing and cleaning data...")
-        parsed_transactions = parse_transactions(raw_lines)
-        print(f"✓ Parsed {len(parsed_transactions)} records")
+        parsed_transactions, quality_report = check_data_quality(
+            raw_lines,
+            quarantine_file="output/quarantine.txt"
+        )
+        print(f"✓ Parsed {len(parsed_transactions)} records "
+              f"({quality_report['rejected']} rejected)")
+
+        for rule, count in quality_report['rule_counts'].items():
+            if count:
+                print(f"  - {rule}: {count}")
 
         if not parsed_transactions:
             print("✗ No valid records after parsing. Exiting program.")
@@ -97,7 +108,7 @@ def main():
             max_amount=max_amount
         )
 
-        print(f"✓ Valid: {summary['final_count']} | Invalid: {summary['invalid']}")
+        print(f"✓ Valid: {summary['final_count']} | Invalid: {quality_report['rejected']}")
 
         if not valid_transactions:
             print("✗ No valid transactions available for analysis.")
@@ -147,7 +158,7 @@ def main():
         # -------------------------------------------------
         # [9/10] Part 4 – Generate report
         print("\n[9/10] Generating report...")
-        generate_sales_report(valid_transactions, enriched_transactions)
+        generate_sales_report(valid_transactions, enriched_transactions, exact=True)
 
         # -------------------------------------------------
         print("\n[10/10] Process Complete!")
@@ -0,0 +1,76 @@
+from utils.anomaly_detection import detect_anomalies
+
+
+def _tx(day, revenue, product='Mouse'):
+    return {
+        'Date': day, 'Region': 'North', 'ProductName': product, 'CustomerID': 'C001',
+        'Quantity': 1, 'UnitPrice': float(revenue), 'UnitPricePaise': revenue * 100
+    }
+
+
+def test_empty_input_has_no_anomalies():
+    assert detect_anomalies([]) == []
+    assert detect_anomalies([], by='region') == []
+
+
+def test_spike_is_flagged_with_matching_expected_value():
+    revenues = [100, 110, 90, 105, 95, 100, 102, 98, 1000]
+    transactions = [_tx(f"2024-12-{i + 1:02d}", r) for i, r in enumerate(revenues)]
+
+    anomalies = detect_anomalies(transactions)
+
+    assert [a['date'] for a in anomalies] == ['2024-12-09']
+    assert 90 <= anomalies[0]['expected'] <= 110
+
+
+def test_sparse_product_series_is_not_scored():
+    # Sells on 3 of 10 days; zero-filled days must not make spikes out of sales
+    transactions = [_tx(f"2024-12-{i + 1:02d}", 100, 'Filler') for i in range(10)]
+    transactions += [_tx(day, 5000, 'Keyboard') for day in ('2024-12-01', '2024-12-06', '2024-12-10')]
+
+    anomalies = detect_anomalies(transactions, by='product')
+
+    assert all(a['group'] != 'Keyboard' for a in anomalies)
+
+
+def test_days_without_any_sales_are_filled_in_every_scope():
+    # 2024-12-08 has no sales at all; it is still a day, scored as 0
+    revenues = [100, 110, 90, 105, 95, 100, 102, None, 98, 101]
+    transactions = [
+        _tx(f"2024-12-{i + 1:02d}", r) for i, r in enumerate(revenues) if r is not None
+    ]
+
+    for by in (None, 'region'):
+        anomalies = detect_anomalies(transactions, by=by)
+        assert [(a['date'], a['revenue']) for a in anomalies] == [('2024-12-08', 0.0)]
+
+
+def test_ordinary_days_of_an_intermittent_group_are_not_flagged():
+    # Sells every other day with widely varying totals, then one real spike
+    revenues = [300, 0, 2500, 0, 800, 0, 1800, 0, 1200, 0, 3000, 0, 600, 0, 60000]
+    transactions = [
+        _tx(f"2024-12-{i + 1:02d}", r) for i, r in enumerate(revenues) if r
+    ]
+
+    anomalies = detect_anomalies(transactions, by='region')
+
+    assert [a['date'] for a in anomalies] == ['2024-12-15']
+
+
+def test_states_score_new_days_without_the_old_transactions():
+    revenues = [100, 110, 90, 105, 95, 100, 102, 98, 1000, 97, 0, 103, 99]
+    transactions = [
+        _tx(f"2024-12-{i + 1:02d}", r) for i, r in enumerate(revenues) if r
+    ]
+    full = detect_anomalies(transactions, by='region')
+
+    states = {}
+    first = detect_anomalies(transactions[:8], by='region', states=states)
+    rest = detect_anomalies(transactions[8:], by='region', states=states)
+
+    assert first == []
+    assert first + rest == full
+    assert states['North']['count'] == len(revenues)
+    # Days the state already covers are ignored
+    assert detect_anomalies(transactions[-1:], by='region', states=states) == []
+    assert states['North']['count'] == len(revenues)
@@ -0,0 +1,53 @@
+from utils.customer_analytics import _quantile_scores, build_customer_index, rfm_scores
+
+
+def _tx(day, customer='C001', price=100.0):
+    return {'CustomerID': customer, 'Date': day, 'Quantity': 1, 'UnitPrice': price}
+
+
+def test_distinct_values_spread_over_all_scores():
+    assert _quantile_scores(list(range(10)), 5) == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+
+
+def test_tied_group_at_bottom_gets_its_mid_rank_score():
+    assert _quantile_scores([1] * 8 + [2, 5], 5) == [3] * 8 + [5, 5]
+
+
+def test_tied_group_at_top_gets_its_mid_rank_score():
+    assert _quantile_scores([10] * 8 + [1, 2], 5) == [4] * 8 + [1, 1]
+
+
+def test_recency_tie_on_latest_day_scores_high():
+    transactions = [_tx('2024-12-30', f'C{i}') for i in range(8)]
+    transactions += [_tx('2024-12-01', 'C8'), _tx('2024-12-02', 'C9')]
+
+    scores = rfm_scores(build_customer_index(transactions))
+
+    assert {scores[f'C{i}']['r_score'] for i in range(8)} == {4}
+    assert scores['C8']['r_score'] == scores['C9']['r_score'] == 1
+
+
+def test_frequency_tie_at_top_scores_high():
+    transactions = [_tx(day, f'C{i}') for i in range(8) for day in ('2024-12-01', '2024-12-02', '2024-12-03')]
+    transactions += [_tx('2024-12-03', 'C8'), _tx('2024-12-03', 'C9')]
+
+    scores = rfm_scores(build_customer_index(transactions))
+
+    assert {scores[f'C{i}']['f_score'] for i in range(8)} == {4}
+    assert scores['C8']['f_score'] == scores['C9']['f_score'] == 1
+
+
+def test_monetary_tie_at_top_scores_high():
+    transactions = [_tx('2024-12-03', f'C{i}', price=5000.0) for i in range(8)]
+    transactions += [_tx('2024-12-03', 'C8', price=10.0), _tx('2024-12-03', 'C9', price=20.0)]
+
+    scores = rfm_scores(build_customer_index(transactions))
+
+    assert {scores[f'C{i}']['m_score'] for i in range(8)} == {4}
+    assert scores['C8']['m_score'] == scores['C9']['m_score'] == 1
+
+
+def test_invalid_dates_are_skipped_not_fatal():
+    index = build_customer_index([_tx('2024-12-01'), _tx('12/01/2024'), _tx('')])
+
+    assert list(index['C001']['dates']) == [739221]
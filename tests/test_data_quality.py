@@ -0,0 +1,79 @@
+from collections import Counter
+
+from utils.data_quality import check_data_quality
+from utils.file_handler import parse_transactions
+
+GOOD = 'T001|2024-12-01|P101|Mouse|2|1,500|C001|North'
+
+
+def test_rule_counts_cover_every_failed_rule():
+    lines = [
+        GOOD,
+        'T002|2024-12-01|P101|Mouse|2',                        # field_count
+        'T003|2024-12-01|P101|Mouse|two|100|C001|North',        # quantity_format
+        'T004|2024-12-01|P101|Mouse|2|abc|C001|North',          # price_format
+        'X005|2024-12-01|P101|Mouse|0|100|C001|',               # id, quantity, region
+        'T006|2024-12-01|Q101|Mouse|1|-5|D001|South',           # product, price, customer
+    ]
+
+    valid, report = check_data_quality(lines)
+
+    assert [tx['TransactionID'] for tx in valid] == ['T001']
+    assert valid[0]['Amount'] == 3000.0
+    assert report['total_input'] == 6
+    assert report['rejected'] == 5
+    assert report['rule_counts'] == {
+        'field_count': 1,
+        'quantity_format': 1,
+        'price_format': 1,
+        'quantity_not_positive': 1,
+        'price_not_positive': 1,
+        'bad_transaction_id': 1,
+        'bad_product_id': 1,
+        'bad_customer_id': 1,
+        'missing_region': 1
+    }
+
+
+def test_reservoir_sample_is_bounded_and_uniform():
+    lines = [f'X{i:03d}|2024-12-01|P101|Mouse|1|100|C001|North' for i in range(20)]
+    picks = Counter()
+
+    for seed in range(2000):
+        _, report = check_data_quality(lines, sample_size=5, seed=seed)
+        samples = report['samples']['bad_transaction_id']
+        assert len(samples) == 5
+        picks.update(samples)
+
+    # Every line is kept with probability 5/20 (expected 500 of 2000 runs)
+    assert len(picks) == 20
+    assert all(400 < count < 600 for count in picks.values())
+
+
+def test_quarantine_file_lists_rejected_lines_with_rules(tmp_path):
+    path = tmp_path / 'quarantine.txt'
+    bad = 'X005|2024-12-01|P101|Mouse|0|100|C001|North'
+
+    check_data_quality([GOOD, bad], quarantine_file=str(path))
+
+    assert path.read_text(encoding='utf-8') == (
+        f'{bad}|quantity_not_positive,bad_transaction_id\n'
+    )
+
+
+def test_parse_transactions_uses_the_same_row_parser():
+    lines = [GOOD, 'T002|2024-12-01|P101|Mouse|2', 'T003|2024-12-01|P101|Mouse|x|1|C001|N']
+
+    parsed = parse_transactions(lines)
+    valid, _ = check_data_quality([GOOD])
+
+    assert len(parsed) == 1
+    assert parsed[0] == {k: v for k, v in valid[0].items() if k != 'Amount'}
+
+
+def test_price_rounding_to_zero_paise_is_rejected():
+    valid, report = check_data_quality([GOOD, 'T002|2024-12-01|P101|Mouse|1|0.004|C001|North'])
+
+    assert [tx['TransactionID'] for tx in valid] == ['T001']
+    assert report['rule_counts']['price_not_positive'] == 1
+    assert parse_transactions(['T002|2024-12-01|P101|Mouse|1|0.004|C001|North'])[0]['UnitPricePaise'] == 0
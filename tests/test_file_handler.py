@@ -0,0 +1,42 @@
+import gzip
+
+from utils.file_handler import read_sales_data, _iter_gzip_parallel
+
+HEADER = 'TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region'
+
+
+def test_fallback_encoding_keeps_rows_with_0x85(tmp_path):
+    # 0x85 is cp1252 '…' and latin-1 NEL; it must not split the row
+    path = tmp_path / 'sales.txt'
+    path.write_bytes(
+        (HEADER + '\r\n').encode('ascii')
+        + b'T001|2024-12-01|P101|Caf\xe9 Mug\x85Deluxe|2|100|C001|North\r\n'
+        + b'T002|2024-12-02|P102|Pen|1|10|C002|South\r\n'
+    )
+
+    lines = read_sales_data(str(path))
+
+    assert len(lines) == 2
+    assert lines[0].split('|')[3] == 'Caf\xe9 Mug\x85Deluxe'
+
+
+def test_utf8_form_feed_inside_field_is_not_a_line_break(tmp_path):
+    path = tmp_path / 'sales.txt'
+    path.write_text(
+        HEADER + '\nT001|2024-12-01|P101|Mug\x0cDeluxe|2|100|C001|North\n',
+        encoding='utf-8'
+    )
+
+    lines = read_sales_data(str(path))
+
+    assert lines == ['T001|2024-12-01|P101|Mug\x0cDeluxe|2|100|C001|North']
+
+
+def test_parallel_gzip_survives_false_member_header(tmp_path):
+    # Stored (level 0) blocks copy the header pattern into the compressed stream
+    tricky = b'A' * 100 + b'\x1f\x8b\x08\x00' + b'B' * 100
+    parts = [b'first\n', tricky, b'\nlast\n']
+    path = tmp_path / 'sales.gz'
+    path.write_bytes(b''.join(gzip.compress(p, compresslevel=0) for p in parts))
+
+    assert b''.join(_iter_gzip_parallel(str(path))) == b''.join(parts)
@@ -0,0 +1,66 @@
+from utils import market_basket
+from utils.market_basket import product_affinity
+
+
+def _tx(customer, product, day='2024-12-01'):
+    return {'CustomerID': customer, 'Date': day, 'ProductName': product}
+
+
+# Baskets: C1 {A, B, C}, C2 {A, B}, C3 {A, C}, C4 {B}
+TRANSACTIONS = [
+    _tx('C1', 'A'), _tx('C1', 'B'), _tx('C1', 'C'),
+    _tx('C2', 'A'), _tx('C2', 'B'),
+    _tx('C3', 'A'), _tx('C3', 'C'),
+    _tx('C4', 'B'), _tx('C4', 'B')
+]
+
+
+def _by_pair(rules):
+    return {(r['antecedent'], r['consequent']): r for r in rules}
+
+
+def test_support_confidence_and_lift_match_hand_computed_values():
+    # A in 3/4 baskets, B in 3/4, C in 2/4; AB 2/4, AC 2/4, BC 1/4
+    rules = _by_pair(product_affinity(TRANSACTIONS, min_support=0.5))
+
+    assert set(rules) == {('A', 'B'), ('B', 'A'), ('A', 'C'), ('C', 'A')}
+
+    assert rules[('A', 'B')]['pair_count'] == 2
+    assert rules[('A', 'B')]['support'] == 0.5
+    assert rules[('A', 'B')]['confidence'] == 0.6667
+    assert rules[('A', 'B')]['lift'] == 0.8889
+
+    assert rules[('A', 'C')]['confidence'] == 0.6667
+    assert rules[('A', 'C')]['lift'] == 1.3333
+    assert rules[('C', 'A')]['confidence'] == 1.0
+    assert rules[('C', 'A')]['lift'] == 1.3333
+
+
+def test_min_support_and_min_confidence_prune_rules():
+    rules = _by_pair(product_affinity(TRANSACTIONS, min_support=0.25, min_confidence=0.9))
+
+    # B-C (support 1/4) now passes support; only C -> A reaches 0.9 confidence
+    assert set(rules) == {('C', 'A')}
+
+
+def test_day_baskets_split_by_date():
+    transactions = [_tx('C1', 'A', '2024-12-01'), _tx('C1', 'B', '2024-12-02')]
+
+    assert product_affinity(transactions, by='customer', min_support=0.5) != []
+    assert product_affinity(transactions, by='day', min_support=0.5) == []
+
+
+def test_parallel_chunks_match_serial(monkeypatch):
+    transactions = [
+        _tx(f'C{i}', f'P{(i * j) % 7}')
+        for i in range(60)
+        for j in range(1, 5)
+    ]
+    serial = product_affinity(transactions, min_support=0.05, chunk_size=7)
+
+    # Force real worker processes even on a single-CPU machine
+    monkeypatch.setattr(market_basket.os, 'cpu_count', lambda: 4)
+    parallel = product_affinity(transactions, min_support=0.05, chunk_size=7, workers=3)
+
+    assert serial
+    assert parallel == serial
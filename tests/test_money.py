@@ -0,0 +1,66 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from utils.money import to_minor_units, parse_price, to_display, percentage
+
+
+@pytest.mark.parametrize('text, paise', [
+    ('1916', 191600),
+    ('1,916', 191600),
+    ('173.5', 17350),
+    ('1,234.56', 123456),
+    ('+2.05', 205),
+    ('-0.5', -50),
+    ('-12.34', -1234),
+    ('.5', 50),
+    ('1.005', 101),       # more than 2 decimals: half up, not float's 100.49999
+    ('17.305', 1731),
+    ('-1.005', -101),     # half away from zero
+    ('0.004', 0),
+    ('1e2', 10000),
+    ('2.5E-1', 25),
+    (' 7.1 ', 710),
+])
+def test_to_minor_units(text, paise):
+    assert to_minor_units(text) == paise
+
+
+@pytest.mark.parametrize('text', ['', 'abc', '1.2.3', 'nan', 'inf', '--1'])
+def test_to_minor_units_rejects_non_numbers(text):
+    with pytest.raises(ValueError):
+        to_minor_units(text)
+
+
+def test_parse_price_matches_float_and_exact_paths():
+    rng = random.Random(7)
+    texts = ['1,234.56', '0.004', '17.305', '1e2', '-0.5', '.5', '1.005']
+    for _ in range(10000):
+        paise = rng.randrange(-10 ** 9, 10 ** 9)
+        texts.append(f"{'-' if paise < 0 else ''}{abs(paise) // 100:,}.{abs(paise) % 100:02d}")
+
+    for text in texts:
+        value, paise = parse_price(text)
+        assert value == float(text.replace(',', ''))
+        assert paise == to_minor_units(text)
+
+
+@pytest.mark.parametrize('text', ['abc', 'nan', 'inf', '-inf'])
+def test_parse_price_rejects_non_finite(text):
+    with pytest.raises(ValueError):
+        parse_price(text)
+
+
+def test_to_display_is_exact():
+    assert to_display(123456) == Decimal('1234.56')
+    assert to_display(-5) == Decimal('-0.05')
+    assert str(to_display(10)) == '0.10'
+
+
+def test_percentage_rounds_half_up_and_handles_zero_total():
+    assert percentage(1, 8) == 12.5
+    assert percentage(1, 3) == 33.33
+    assert percentage(2, 3) == 66.67
+    assert percentage(1, 200) == 0.5
+    assert percentage(5, 0) == 0.0
@@ -0,0 +1,265 @@
+from bisect import insort, bisect_left
+from collections import deque
+from datetime import date
+
+from utils.money import MINOR_UNITS
+
+# Scale factor that makes MAD comparable to a standard deviation
+MAD_SCALE = 1.4826
+
+
+def create_detector(window=7, alpha=0.3, min_spread_ratio=0.1, min_mad_ratio=0.5):
+    """
+    Creates the streaming state for one daily revenue series
+
+    Holds Welford running mean/variance over all days, an EWMA
+    mean/variance and a rolling window of the last `window` days with
+    sales (kept sorted for the median), plus the number of days with sales
+    and the last day added (a date ordinal, set by detect_anomalies).
+    Each spread (std, EWMA std, MAD) is floored at min_spread_ratio times
+    the series level (the larger of its center and the running mean), so
+    flat history does not turn small moves into huge scores. The MAD is
+    also floored at min_mad_ratio times the mean of the days with sales:
+    a handful of daily totals that range over orders of magnitude gives
+    a MAD far too small to judge the next one by.
+    """
+    return {
+        'min_spread_ratio': min_spread_ratio,
+        'min_mad_ratio': min_mad_ratio,
+        'count': 0,
+        'active_days': 0,
+        'last_day': None,
+        'mean': 0.0,
+        'm2': 0.0,
+        'alpha': alpha,
+        'ewma': None,
+        'ewm_var': 0.0,
+        'window': window,
+        'recent': deque(),
+        'sorted_recent': []
+    }
+
+
+def _median(ordered):
+    """
+    Median of an already sorted list
+    """
+    n = len(ordered)
+    mid = n // 2
+    return ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
+
+def _score(value, center, spread, floor):
+    """
+    Standardised distance of value from center (0 if spread is 0)
+
+    The spread is never taken below floor.
+    """
+    spread = max(spread, floor)
+    return (value - center) / spread if spread > 0 else 0.0
+
+
+def update_detector(state, value):
+    """
+    Scores a new value against the history so far, then adds it to the state
+
+    Welford and EWMA updates are O(1); the rolling median/MAD cost depends
+    only on the window size, never on the length of the history.
+    Days without sales (value 0) go into the Welford mean only and get an
+    ewma_score and mad_score of 0: on a group that often sells nothing,
+    zeros would otherwise drag the EWMA and median down and make every
+    ordinary sale look like a spike. A missing day is left to the z-score.
+
+    Returns: dictionary with 'zscore' (Welford), 'ewma_score', 'mad_score'
+    and the matching centers 'mean', 'ewma' and 'median', all computed
+    before the value is added
+    """
+    # Score against the history before this value
+    count = state['count']
+    std = (state['m2'] / (count - 1)) ** 0.5 if count > 1 else 0.0
+
+    ewma = state['ewma']
+    expected = value if ewma is None else ewma
+
+    ordered = state['sorted_recent']
+    if ordered:
+        median = _median(ordered)
+        mad = _median(sorted(abs(v - median) for v in ordered)) * MAD_SCALE
+    else:
+        median = mad = 0.0
+
+    ratio = state['min_spread_ratio']
+    level = abs(state['mean'])
+    # Mean of the days with sales (running total / days with sales)
+    active = state['active_days']
+    active_level = level * count / active if active else 0.0
+    mad_floor = max(ratio * max(level, abs(median)), state['min_mad_ratio'] * active_level)
+    scores = {
+        'zscore': _score(value, state['mean'], std, ratio * level),
+        'ewma_score': _score(value, expected, state['ewm_var'] ** 0.5,
+                             ratio * max(level, abs(expected))) if value else 0.0,
+        'mad_score': _score(value, median, mad, mad_floor) if value else 0.0,
+        'mean': state['mean'],
+        'ewma': expected,
+        'median': median
+    }
+
+    # Welford running mean/variance
+    count += 1
+    delta = value - state['mean']
+    state['mean'] += delta / count
+    state['m2'] += delta * (value - state['mean'])
+    state['count'] = count
+
+    if not value:
+        return scores
+    state['active_days'] += 1
+
+    # Exponentially weighted mean/variance of days with sales
+    if ewma is None:
+        state['ewma'] = value
+    else:
+        alpha = state['alpha']
+        diff = value - ewma
+        state['ewma'] = ewma + alpha * diff
+        state['ewm_var'] = (1 - alpha) * (state['ewm_var'] + alpha * diff * diff)
+
+    # Rolling window of days with sales for median/MAD
+    state['recent'].append(value)
+    insort(ordered, value)
+    if len(state['recent']) > state['window']:
+        old = state['recent'].popleft()
+        del ordered[bisect_left(ordered, old)]
+
+    return scores
+
+
+def _daily_series(transactions, by, exact):
+    """
+    Builds daily revenue series as {group: {date_ordinal: revenue}} in one pass
+
+    by=None gives a single series keyed None. Transactions whose Date is
+    not an ISO date (YYYY-MM-DD) are skipped and counted in a warning.
+    """
+    if by is None:
+        field = None
+    elif by == 'region':
+        field = 'Region'
+    elif by == 'product':
+        field = 'ProductName'
+    else:
+        raise ValueError(f"Unknown anomaly grouping: {by}")
+
+    series = {}
+    ordinals = {}
+    skipped = 0
+
+    for tx in transactions:
+        # Few distinct dates, so parse each one only once
+        day = ordinals.get(tx['Date'])
+        if day is None:
+            try:
+                day = date.fromisoformat(tx['Date']).toordinal()
+            except (ValueError, TypeError):
+                skipped += 1
+                continue
+            ordinals[tx['Date']] = day
+
+        group = tx[field] if field else None
+        price = tx['UnitPricePaise'] if exact else tx['UnitPrice']
+
+        if group not in series:
+            series[group] = {}
+        series[group][day] = series[group].get(day, 0) + tx['Quantity'] * price
+
+    if skipped:
+        print(f"⚠ Skipped {skipped} transactions with invalid dates")
+
+    if exact:
+        for days in series.values():
+            for day in days:
+                days[day] = days[day] / MINOR_UNITS
+
+    return series
+
+
+#Anomaly Detection: unusual revenue days
+def detect_anomalies(transactions, by=None, threshold=3.0, window=7,
+                     alpha=0.3, min_history=5, min_spread_ratio=0.1,
+                     min_mad_ratio=0.5, min_active_share=0.5, exact=False,
+                     states=None):
+    """
+    Flags days whose revenue is unusual compared with the days before them
+
+    by=None checks total daily revenue; by='region' or by='product' checks
+    each group separately. Every series runs over each calendar day from
+    the group's first sale to the last date in transactions; days without
+    sales count as 0.
+    A day is flagged when any of the Welford z-score, EWMA score or
+    rolling median/MAD score exceeds threshold, once at least min_history
+    earlier days are available. Groups with sales on fewer than
+    min_active_share of their days so far are too sparse to score.
+
+    states is an optional dictionary {group: detector state} that is
+    updated in place. Pass the same dictionary with only the new days'
+    transactions to score them against the stored history, without
+    rebuilding it; days a group's state already covers are ignored.
+
+    Returns: list of anomaly dictionaries
+    {'scope', 'group', 'date', 'revenue', 'expected', 'score', 'methods'}
+    sorted by date; 'expected' is the center used by the strongest method
+    """
+    series = _daily_series(transactions, by, exact)
+    if states is None:
+        states = {}
+
+    scope = by or 'overall'
+    last = max((max(days) for days in series.values()), default=None)
+    if last is None:
+        return []
+
+    centers = {'zscore': 'mean', 'ewma': 'ewma', 'mad': 'median'}
+    anomalies = []
+
+    for group in set(series) | set(states):
+        days = series.get(group, {})
+
+        if group in states:
+            state = states[group]
+            first = state['last_day'] + 1
+        else:
+            state = states[group] = create_detector(window, alpha, min_spread_ratio, min_mad_ratio)
+            first = min(days)
+
+        for day in range(first, last + 1):
+            revenue = float(days.get(day, 0))
+            history = state['count']
+            sparse = state['active_days'] < min_active_share * history
+            scores = update_detector(state, revenue)
+            state['last_day'] = day
+
+            if history < min_history or sparse:
+                continue
+
+            methods = {
+                'zscore': scores['zscore'],
+                'ewma': scores['ewma_score'],
+                'mad': scores['mad_score']
+            }
+            flagged = [name for name, value in methods.items() if abs(value) > threshold]
+
+            if flagged:
+                strongest = max(flagged, key=lambda name: abs(methods[name]))
+                anomalies.append({
+                    'scope': scope,
+                    'group': group,
+                    'date': date.fromordinal(day).isoformat(),
+                    'revenue': revenue,
+                    'expected': scores[centers[strongest]],
+                    'score': round(methods[strongest], 2),
+                    'methods': flagged
+                })
+
+    anomalies.sort(key=lambda x: (x['date'], str(x['group'])))
+
+    return anomalies
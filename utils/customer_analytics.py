@@ -0,0 +1,261 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from functools import lru_cache
+
+
+#Customer Index: per-customer purchase timeline
+def build_customer_index(transactions):
+    """
+    Builds a per-customer index of transactions in date order
+
+    Each customer maps to compact parallel arrays:
+    'dates' (date ordinals, array('l')) and 'amounts' (array('d')),
+    sorted by date.
+
+    Transactions whose Date is not an ISO date (YYYY-MM-DD) are skipped
+    and counted in a warning.
+
+    Returns: dictionary {customer_id: {'dates': array, 'amounts': array}}
+    """
+    index = {}
+    ordinals = {}
+    skipped = 0
+
+    for tx in transactions:
+        customer = tx['CustomerID']
+
+        # Few distinct dates, so parse each one only once
+        ordinal = ordinals.get(tx['Date'])
+        if ordinal is None:
+            try:
+                ordinal = date.fromisoformat(tx['Date']).toordinal()
+            except (ValueError, TypeError):
+                skipped += 1
+                continue
+            ordinals[tx['Date']] = ordinal
+        amount = tx['Quantity'] * tx['UnitPrice']
+
+        if customer not in index:
+            index[customer] = {
+                'dates': array('l'),
+                'amounts': array('d')
+            }
+
+        index[customer]['dates'].append(ordinal)
+        index[customer]['amounts'].append(amount)
+
+    # Sort each timeline once; most are already in order
+    for entry in index.values():
+        dates = entry['dates']
+        if any(dates[i] > dates[i + 1] for i in range(len(dates) - 1)):
+            order = sorted(range(len(dates)), key=dates.__getitem__)
+            entry['dates'] = array('l', (dates[i] for i in order))
+            entry['amounts'] = array('d', (entry['amounts'][i] for i in order))
+
+    if skipped:
+        print(f"⚠ Skipped {skipped} transactions with invalid dates")
+
+    return index
+
+
+@lru_cache(maxsize=None)
+def _month_key(ordinal):
+    """
+    Returns the month number (year * 12 + month - 1) of a date ordinal
+    """
+    d = date.fromordinal(ordinal)
+    return d.year * 12 + d.month - 1
+
+
+#Cohort Retention Matrix
+def cohort_retention(customer_index):
+    """
+    Groups customers into cohorts by first-purchase month and counts how
+    many of them purchased again in each following month
+
+    Returns: dictionary {cohort_month ('YYYY-MM'): {
+        'size': customers in cohort,
+        'active': [customers active in month 0, 1, 2, ...],
+        'retention': [percentage of cohort active in month 0, 1, 2, ...]
+    }} sorted by cohort month
+    """
+    cohorts = {}
+
+    for entry in customer_index.values():
+        dates = entry['dates']
+        if not dates:
+            continue
+
+        first = _month_key(dates[0])
+        offsets = {_month_key(d) - first for d in dates}
+
+        if first not in cohorts:
+            cohorts[first] = {'size': 0, 'active': []}
+
+        cohort = cohorts[first]
+        cohort['size'] += 1
+
+        active = cohort['active']
+        needed = max(offsets) + 1
+        if len(active) < needed:
+            active.extend([0] * (needed - len(active)))
+
+        for offset in offsets:
+            active[offset] += 1
+
+    result = {}
+    for key in sorted(cohorts):
+        cohort = cohorts[key]
+        label = f"{key // 12:04d}-{key % 12 + 1:02d}"
+        result[label] = {
+            'size': cohort['size'],
+            'active': cohort['active'],
+            'retention': [
+                round(count / cohort['size'] * 100, 2)
+                for count in cohort['active']
+            ]
+        }
+
+    return result
+
+
+def _quantile_scores(values, bins):
+    """
+    Scores each value from 1 to bins by its quantile among all values
+
+    A tied group gets the score of its average (mid) rank, so a large
+    group of equal values lands in the middle of the range it spans,
+    whether it sits at the bottom (one-time buyers) or the top (everyone
+    who bought on the latest day) of the scale.
+    """
+    ordered = sorted(values)
+    n = len(ordered)
+    scores = []
+
+    for v in values:
+        # Mid rank (1-based) of the tied group, as a percentile in [0, 1)
+        mid_rank = (bisect_left(ordered, v) + bisect_right(ordered, v) + 1) / 2
+        scores.append(min(bins, int((mid_rank - 0.5) * bins / n) + 1))
+
+    return scores
+
+
+#RFM (Recency, Frequency, Monetary) Scoring
+def rfm_scores(customer_index, as_of=None, bins=5):
+    """
+    Calculates recency, frequency and monetary values per customer and
+    scores each from 1 (worst) to bins (best) by quantile
+
+    as_of is an ISO date string; defaults to the latest purchase date
+
+    Returns: dictionary {customer_id: {
+        'recency_days', 'frequency', 'monetary',
+        'r_score', 'f_score', 'm_score', 'rfm'
+    }} sorted by rfm score descending
+    """
+    customers = []
+    recency = []
+    frequency = []
+    monetary = []
+
+    for customer, entry in customer_index.items():
+        if not entry['dates']:
+            continue
+        customers.append(customer)
+        recency.append(entry['dates'][-1])
+        frequency.append(len(entry['dates']))
+        monetary.append(sum(entry['amounts']))
+
+    if not customers:
+        return {}
+
+    reference = date.fromisoformat(as_of).toordinal() if as_of else max(recency)
+
+    # More recent last purchase = better recency score
+    r_scores = _quantile_scores(recency, bins)
+    f_scores = _quantile_scores(frequency, bins)
+    m_scores = _quantile_scores(monetary, bins)
+
+    result = {}
+    for i, customer in enumerate(customers):
+        result[customer] = {
+            'recency_days': reference - recency[i],
+            'frequency': frequency[i],
+            'monetary': monetary[i],
+            'r_score': r_scores[i],
+            'f_score': f_scores[i],
+            'm_score': m_scores[i],
+            'rfm': f"{r_scores[i]}{f_scores[i]}{m_scores[i]}"
+        }
+
+    return dict(
+        sorted(
+            result.items(),
+            key=lambda x: (x[1]['r_score'] + x[1]['f_score'] + x[1]['m_score'], x[1]['monetary']),
+            reverse=True
+        )
+    )
+
+
+#Inter-purchase Gap Statistics
+def purchase_gap_stats(customer_index):
+    """
+    Calculates the gaps in days between consecutive purchases
+
+    Purchases on the same day count as a single visit.
+
+    Returns: dictionary with
+    'customers': {customer_id: {'gaps', 'avg_gap', 'min_gap', 'max_gap'}}
+        for repeat customers only,
+    'overall': {'repeat_customers', 'one_time_customers',
+        'avg_gap', 'median_gap', 'min_gap', 'max_gap'}
+    """
+    customers = {}
+    all_gaps = array('l')
+    one_time = 0
+
+    for customer, entry in customer_index.items():
+        dates = entry['dates']
+        gaps = array('l', (
+            dates[i + 1] - dates[i]
+            for i in range(len(dates) - 1)
+            if dates[i + 1] != dates[i]
+        ))
+
+        if not gaps:
+            one_time += 1
+            continue
+
+        customers[customer] = {
+            'gaps': list(gaps),
+            'avg_gap': round(sum(gaps) / len(gaps), 2),
+            'min_gap': min(gaps),
+            'max_gap': max(gaps)
+        }
+        all_gaps.extend(gaps)
+
+    overall = {
+        'repeat_customers': len(customers),
+        'one_time_customers': one_time,
+        'avg_gap': 0,
+        'median_gap': 0,
+        'min_gap': 0,
+        'max_gap': 0
+    }
+
+    if all_gaps:
+        ordered = sorted(all_gaps)
+        mid = len(ordered) // 2
+        overall['avg_gap'] = round(sum(ordered) / len(ordered), 2)
+        overall['median_gap'] = (
+            ordered[mid] if len(ordered) % 2
+            else (ordered[mid - 1] + ordered[mid]) / 2
+        )
+        overall['min_gap'] = ordered[0]
+        overall['max_gap'] = ordered[-1]
+
+    return {
+        'customers': customers,
+        'overall': overall
+    }
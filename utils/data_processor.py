@@ -1,42 +1,74 @@
+from utils.money import to_display, percentage
+
+
+def _price_key(exact):
+    """
+    Returns the transaction field holding the unit price for the money mode
+    """
+    return 'UnitPricePaise' if exact else 'UnitPrice'
+
+
+def _money(value, exact):
+    """
+    Converts an accumulated amount to its display value
+    (integer paise become an exact Decimal in exact mode)
+    """
+    return to_display(value) if exact else value
+
+
 #Task 2.1(a): Calculate Total Revenue
-def calculate_total_revenue(transactions):
+def calculate_total_revenue(transactions, exact=False):
     """
     Calculates total revenue from all transactions
+
+    With exact=True amounts are summed as integer paise and returned as
+    an exact Decimal (the same applies to the other aggregators below)
     """
-    total_revenue = 0.0
+    price_key = _price_key(exact)
+    total_revenue = 0 if exact else 0.0
 
     for tx in transactions:
-        total_revenue += tx['Quantity'] * tx['UnitPrice']
+        total_revenue += tx['Quantity'] * tx[price_key]
 
-    return total_revenue
+    return _money(total_revenue, exact)
 
 
 #Task 2.1(b): Region-wise Sales Analysis
-def region_wise_sales(transactions):
+def region_wise_sales(transactions, exact=False):
     """
     Analyzes sales by region
     """
+    price_key = _price_key(exact)
     region_data = {}
-    total_revenue = calculate_total_revenue(transactions)
 
     # Aggregate sales & count
     for tx in transactions:
         region = tx['Region']
-        amount = tx['Quantity'] * tx['UnitPrice']
+        amount = tx['Quantity'] * tx[price_key]
 
         if region not in region_data:
             region_data[region] = {
-                'total_sales': 0.0,
+                'total_sales': 0 if exact else 0.0,
                 'transaction_count': 0
             }
 
         region_data[region]['total_sales'] += amount
         region_data[region]['transaction_count'] += 1
 
-    # Calculate percentage
+    total_revenue = sum(data['total_sales'] for data in region_data.values())
+
+    # Calculate percentage (exact integer ratio in exact mode)
     for region in region_data:
-        region_data[region]['percentage'] = round(
-            (region_data[region]['total_sales'] / total_revenue) * 100, 2
+        if exact:
+            region_data[region]['percentage'] = percentage(
+                region_data[region]['total_sales'], total_revenue
+            )
+        else:
+            region_data[region]['percentage'] = round(
+                (region_data[region]['total_sales'] / total_revenue) * 100, 2
+            )
+        region_data[region]['total_sales'] = _money(
+            region_data[region]['total_sales'], exact
         )
 
     # Sort by total_sales descending
@@ -52,21 +84,22 @@ def region_wise_sales(transactions):
 
 
 #Task 2.1(c): Top Selling Products
-def top_selling_products(transactions, n=5):
+def top_selling_products(transactions, n=5, exact=False):
     """
     Finds top n products by total quantity sold
     """
+    price_key = _price_key(exact)
     product_data = {}
 
     for tx in transactions:
         product = tx['ProductName']
         qty = tx['Quantity']
-        revenue = tx['Quantity'] * tx['UnitPrice']
+        revenue = tx['Quantity'] * tx[price_key]
 
         if product not in product_data:
             product_data[product] = {
                 'quantity': 0,
-                'revenue': 0.0
+                'revenue': 0 if exact else 0.0
             }
 
         product_data[product]['quantity'] += qty
@@ -74,7 +107,7 @@ def top_selling_products(transactions, n=5):
 
     # Convert to list of tuples
     product_list = [
-        (product, data['quantity'], data['revenue'])
+        (product, data['quantity'], _money(data['revenue'], exact))
         for product, data in product_data.items()
     ]
 
@@ -85,20 +118,21 @@ def top_selling_products(transactions, n=5):
 
 
 #Task 2.1(d): Customer Purchase Analysis
-def customer_analysis(transactions):
+def customer_analysis(transactions, exact=False):
     """
     Analyzes customer purchase patterns
     """
+    price_key = _price_key(exact)
     customer_data = {}
 
     for tx in transactions:
         customer = tx['CustomerID']
-        amount = tx['Quantity'] * tx['UnitPrice']
+        amount = tx['Quantity'] * tx[price_key]
         product = tx['ProductName']
 
         if customer not in customer_data:
             customer_data[customer] = {
-                'total_spent': 0.0,
+                'total_spent': 0 if exact else 0.0,
                 'purchase_count': 0,
                 'products_bought': set()
             }
@@ -109,9 +143,10 @@ def customer_analysis(transactions):
 
     # Final calculations
     for customer in customer_data:
-        total = customer_data[customer]['total_spent']
+        total = _money(customer_data[customer]['total_spent'], exact)
         count = customer_data[customer]['purchase_count']
 
+        customer_data[customer]['total_spent'] = total
         customer_data[customer]['avg_order_value'] = round(total / count, 2)
         customer_data[customer]['products_bought'] = list(
             customer_data[customer]['products_bought']
@@ -132,20 +167,21 @@ def customer_analysis(transactions):
 #Task 2.2: Date-based Analysis 
 # (a) Daily Sales Trend
 
-def daily_sales_trend(transactions):
+def daily_sales_trend(transactions, exact=False):
     """
     Analyzes sales trends by date
     """
+    price_key = _price_key(exact)
     daily_data = {}
 
     for tx in transactions:
         date = tx['Date']
-        amount = tx['Quantity'] * tx['UnitPrice']
+        amount = tx['Quantity'] * tx[price_key]
         customer = tx['CustomerID']
 
         if date not in daily_data:
             daily_data[date] = {
-                'revenue': 0.0,
+                'revenue': 0 if exact else 0.0,
                 'transaction_count': 0,
                 'unique_customers': set()
             }
@@ -156,6 +192,7 @@ def daily_sales_trend(transactions):
 
     # Convert set to count
     for date in daily_data:
+        daily_data[date]['revenue'] = _money(daily_data[date]['revenue'], exact)
         daily_data[date]['unique_customers'] = len(
             daily_data[date]['unique_customers']
         )
@@ -165,11 +202,11 @@ def daily_sales_trend(transactions):
 
 
 #(b) Find Peak Sales Day
-def find_peak_sales_day(transactions):
+def find_peak_sales_day(transactions, exact=False):
     """
     Identifies the date with highest revenue
     """
-    daily_data = daily_sales_trend(transactions)
+    daily_data = daily_sales_trend(transactions, exact)
 
     peak_date = max(
         daily_data.items(),
@@ -185,28 +222,29 @@ def find_peak_sales_day(transactions):
 
 #Task 2.3: Product Performance
 #(a) Low Performing Products
-def low_performing_products(transactions, threshold=10):
+def low_performing_products(transactions, threshold=10, exact=False):
     """
     Identifies products with low sales
     """
+    price_key = _price_key(exact)
     product_data = {}
 
     for tx in transactions:
         product = tx['ProductName']
         qty = tx['Quantity']
-        revenue = tx['Quantity'] * tx['UnitPrice']
+        revenue = tx['Quantity'] * tx[price_key]
 
         if product not in product_data:
             product_data[product] = {
                 'quantity': 0,
-                'revenue': 0.0
+                'revenue': 0 if exact else 0.0
             }
 
         product_data[product]['quantity'] += qty
         product_data[product]['revenue'] += revenue
 
     low_products = [
-        (product, data['quantity'], data['revenue'])
+        (product, data['quantity'], _money(data['revenue'], exact))
         for product, data in product_data.items()
         if data['quantity'] < threshold
     ]
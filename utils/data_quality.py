@@ -0,0 +1,185 @@
+import random
+
+from utils.money import parse_price
+
+# Record-level rules shared with validate_and_filter.
+# Each rule is (name, check) where check(tx) returns True when the record passes.
+RECORD_RULES = (
+    ('quantity_not_positive', lambda tx: tx['Quantity'] > 0),
+    # Paise are checked too: a price such as 0.004 rounds to 0 paise
+    ('price_not_positive', lambda tx: tx['UnitPrice'] > 0 and tx.get('UnitPricePaise', 1) > 0),
+    ('bad_transaction_id', lambda tx: tx['TransactionID'].startswith('T')),
+    ('bad_product_id', lambda tx: tx['ProductID'].startswith('P')),
+    ('bad_customer_id', lambda tx: tx['CustomerID'].startswith('C')),
+    ('missing_region', lambda tx: bool(tx['Region']))
+)
+
+# Line-level rules checked while parsing, before a record exists
+PARSE_RULES = ('field_count', 'quantity_format', 'price_format')
+
+RULE_NAMES = PARSE_RULES + tuple(name for name, _ in RECORD_RULES)
+
+
+def is_valid_record(tx):
+    """
+    Fast check that a record passes every record rule
+
+    Mirrors RECORD_RULES as one short-circuit expression so clean rows pay
+    no per-rule overhead; failed_record_rules() is only run for rejects.
+    """
+    try:
+        return (
+            tx['Quantity'] > 0 and
+            tx['UnitPrice'] > 0 and
+            tx.get('UnitPricePaise', 1) > 0 and
+            tx['TransactionID'].startswith('T') and
+            tx['ProductID'].startswith('P') and
+            tx['CustomerID'].startswith('C') and
+            bool(tx['Region'])
+        )
+    except (KeyError, TypeError, AttributeError):
+        return False
+
+
+def failed_record_rules(tx, skip=()):
+    """
+    Returns the names of all record rules the transaction fails
+    """
+    failed = []
+
+    for name, check in RECORD_RULES:
+        if name in skip:
+            continue
+        try:
+            if not check(tx):
+                failed.append(name)
+        except (KeyError, TypeError, AttributeError):
+            failed.append(name)
+
+    return failed
+
+
+def _sample_rejection(report, rng, rule, line, sample_size):
+    """
+    Keeps a bounded uniform sample of rejected lines per rule (reservoir sampling)
+    """
+    seen = report['rule_counts'][rule]
+    samples = report['samples'][rule]
+
+    if len(samples) < sample_size:
+        samples.append(line)
+    else:
+        slot = rng.randrange(seen)
+        if slot < sample_size:
+            samples[slot] = line
+
+
+def parse_line(line):
+    """
+    Splits and cleans one raw line; shared by parse_transactions and
+    check_data_quality
+
+    Returns: (transaction, failed_parse_rules). The transaction is None
+    when the field count is wrong; a Quantity or UnitPrice that could not
+    be parsed is None and its rule is listed in failed_parse_rules.
+    """
+    parts = line.split('|')
+
+    if len(parts) != 8:
+        return None, ['field_count']
+
+    tid, date, pid, pname, qty, price, cid, region = parts
+    failed = []
+
+    try:
+        qty = int(qty.replace(',', ''))
+    except ValueError:
+        failed.append('quantity_format')
+        qty = None
+
+    # Float price as before, plus exact integer paise for exact mode
+    try:
+        price, paise = parse_price(price)
+    except ValueError:
+        failed.append('price_format')
+        paise = price = None
+
+    transaction = {
+        'TransactionID': tid,
+        'Date': date,
+        'ProductID': pid,
+        'ProductName': pname.replace(',', ''),
+        'Quantity': qty,
+        'UnitPrice': price,
+        'UnitPricePaise': paise,
+        'CustomerID': cid,
+        'Region': region
+    }
+
+    return transaction, failed
+
+
+#Data quality check: parse and validate raw lines in a single pass
+def check_data_quality(raw_lines, sample_size=5, quarantine_file=None, seed=None):
+    """
+    Parses and validates raw lines in one pass, evaluating every rule per line
+
+    Lines with the wrong number of fields only count against 'field_count',
+    since the remaining rules need the individual fields.
+
+    Returns: (valid_transactions, report) where report holds the input and
+    rejected totals, per-rule rejection counts and a reservoir sample of
+    rejected lines for each rule
+    """
+    rng = random.Random(seed)
+
+    report = {
+        'total_input': 0,
+        'valid': 0,
+        'rejected': 0,
+        'rule_counts': {name: 0 for name in RULE_NAMES},
+        'samples': {name: [] for name in RULE_NAMES}
+    }
+    rule_counts = report['rule_counts']
+
+    valid_transactions = []
+    quarantine = open(quarantine_file, 'w', encoding='utf-8') if quarantine_file else None
+
+    total_input = 0
+
+    try:
+        for line in raw_lines:
+            total_input += 1
+            tx, failed = parse_line(line)
+
+            if tx is not None:
+                if not failed:
+                    if is_valid_record(tx):
+                        tx['Amount'] = tx['Quantity'] * tx['UnitPrice']
+                        valid_transactions.append(tx)
+                        continue
+                    failed = failed_record_rules(tx)
+                else:
+                    # Numeric rules cannot be judged on unparseable values
+                    skip = []
+                    if tx['Quantity'] is None:
+                        skip.append('quantity_not_positive')
+                    if tx['UnitPrice'] is None:
+                        skip.append('price_not_positive')
+                    failed.extend(failed_record_rules(tx, skip))
+
+            report['rejected'] += 1
+            for rule in failed:
+                rule_counts[rule] += 1
+                if sample_size:
+                    _sample_rejection(report, rng, rule, line, sample_size)
+            if quarantine:
+                quarantine.write(f"{line}|{','.join(failed)}\n")
+
+    finally:
+        if quarantine:
+            quarantine.close()
+
+    report['total_input'] = total_input
+    report['valid'] = len(valid_transactions)
+    return valid_transactions, report
@@ -1,24 +1,248 @@
+import bz2
+import gzip
+import io
+import lzma
+import mmap
+import os
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.data_quality import (
+    RECORD_RULES,
+    parse_line,
+    is_valid_record,
+    failed_record_rules
+)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Errors raised for corrupt or truncated compressed input
+DECOMPRESSION_ERRORS = (OSError, EOFError, lzma.LZMAError, zlib.error, ImportError)
+if zstandard is not None:
+    DECOMPRESSION_ERRORS += (zstandard.ZstdError,)
+
+
+# Compression formats recognised by suffix or by leading magic bytes
+COMPRESSION_SUFFIXES = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.zst': 'zstd'
+}
+
+COMPRESSION_MAGIC = {
+    b'\x1f\x8b': 'gzip',
+    b'BZh': 'bz2',
+    b'\xfd7zXZ\x00': 'xz',
+    b'\x28\xb5\x2f\xfd': 'zstd'
+}
+
+GZIP_MEMBER_MAGIC = b'\x1f\x8b\x08'
+
+
+def _detect_compression(filename):
+    """
+    Returns the compression format of a file ('gzip', 'bz2', 'xz', 'zstd')
+    or None for plain text
+    """
+    suffix = os.path.splitext(filename)[1].lower()
+    if suffix in COMPRESSION_SUFFIXES:
+        return COMPRESSION_SUFFIXES[suffix]
+
+    with open(filename, 'rb') as file:
+        head = file.read(6)
+
+    for magic, fmt in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return fmt
+
+    return None
+
+
+def _gzip_member_offsets(data):
+    """
+    Finds the start offset of every candidate gzip member header
+
+    Returns: list of offsets, ending with len(data)
+    """
+    offsets = [0]
+    pos = data.find(GZIP_MEMBER_MAGIC, 1)
+
+    while pos != -1:
+        # Reserved flag bits must be zero in a real member header
+        if pos + 3 < len(data) and not data[pos + 3] & 0xE0:
+            offsets.append(pos)
+        pos = data.find(GZIP_MEMBER_MAGIC, pos + 1)
+
+    offsets.append(len(data))
+    return offsets
+
+
+def _inflate_member(member):
+    """
+    Inflates one gzip member, returning None unless it is complete on its own
+    """
+    decomp = zlib.decompressobj(wbits=31)
+    try:
+        chunk = decomp.decompress(member)
+    except zlib.error:
+        return None
+
+    if not decomp.eof or decomp.unused_data:
+        return None
+    return chunk
+
+
+def _iter_gzip_parallel(filename, workers=None):
+    """
+    Yields the decompressed members of a multi-member gzip file in order,
+    inflating a bounded number of members ahead in worker threads
+    (zlib releases the GIL while inflating)
+
+    The compressed file is memory-mapped and only the members in flight are
+    copied out of it, so neither the compressed nor the decompressed file
+    is held in memory as a whole.
+    """
+    with open(filename, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from _inflate_members(mm, _gzip_member_offsets(mm), workers)
+
+
+def _inflate_members(data, offsets, workers):
+    """
+    Inflates the segments between offsets in parallel, yielding them in order
+
+    A header pattern inside compressed data gives a false split: the
+    segment before it comes back incomplete. It is merged with the
+    following segments and only that part is retried.
+    """
+    segments = list(zip(offsets, offsets[1:]))
+    count = len(segments)
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    in_flight = workers * 2
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        next_submit = 0
+        i = 0
+
+        while i < count:
+            # Keep a bounded number of segments in flight
+            while next_submit < count and len(pending) < in_flight:
+                a, b = segments[next_submit]
+                pending.append((next_submit, executor.submit(_inflate_member, data[a:b])))
+                next_submit += 1
+
+            chunk = pending.popleft()[1].result()
+            start, end = segments[i]
+
+            while chunk is None and i + 1 < count:
+                i += 1
+                # The parallel result for the merged segment is not usable
+                if pending and pending[0][0] == i:
+                    pending.popleft()
+                else:
+                    next_submit = max(next_submit, i + 1)
+                end = segments[i][1]
+                chunk = _inflate_member(data[start:end])
+
+            if chunk is None:
+                # Last segment (e.g. trailing padding or corruption): let gzip
+                # accept it or raise the proper error
+                chunk = gzip.decompress(data[start:end])
+
+            yield chunk
+            i += 1
+
+
+class _ChunkReader(io.RawIOBase):
+    """
+    Read-only binary stream over an iterator of byte chunks
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b''
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self):
+        if hasattr(self._chunks, 'close'):
+            self._chunks.close()
+        super().close()
+
+
+def _open_binary(filename, parallel=False):
+    """
+    Opens a file as a binary stream, decompressing on the fly
+    """
+    fmt = _detect_compression(filename)
+
+    if fmt == 'gzip' and parallel:
+        return io.BufferedReader(_ChunkReader(_iter_gzip_parallel(filename)))
+
+    if fmt == 'gzip':
+        return gzip.open(filename, 'rb')
+    if fmt == 'bz2':
+        return bz2.open(filename, 'rb')
+    if fmt == 'xz':
+        return lzma.open(filename, 'rb')
+    if fmt == 'zstd':
+        if zstandard is None:
+            raise ImportError("zstandard package is required to read .zst files")
+        return zstandard.open(filename, 'rb')
+    return open(filename, 'rb')
+
+
 #Task 1.1 Takes care of reading sales data from file handling encoding issues
-def read_sales_data(filename):
+def read_sales_data(filename, parallel=False):
     """
     Reads sales data from file handling encoding issues
 
+    Plain text and .gz/.bz2/.xz/.zst files are supported. The file is
+    decompressed and decoded as a stream, line by line, in a single pass;
+    only if an encoding fails is the stream reopened with the next one.
+    Set parallel=True to inflate multi-member gzip files in parallel.
+
     Returns: list of raw lines (strings)
     """
 
     encodings = ['utf-8', 'latin-1', 'cp1252']
-    lines = []
 
     for encoding in encodings:
-        try:
-            with open(filename, 'r', encoding=encoding) as file:
-                raw_lines = file.readlines()
+        lines = []
 
-            # Skip header and remove empty lines
-            for line in raw_lines[1:]:
-                line = line.strip()
-                if line:
-                    lines.append(line)
+        try:
+            # newline=None splits on \n, \r and \r\n only, not on characters
+            # such as \x85 (cp1252 '…') or \x0c inside a field
+            with io.TextIOWrapper(_open_binary(filename, parallel),
+                                  encoding=encoding, newline=None) as file:
+                next(file, None)  # Skip header
+
+                # Remove empty lines
+                for line in file:
+                    line = line.strip()
+                    if line:
+                        lines.append(line)
 
             print(f"File read successfully using encoding: {encoding}")
             return lines
@@ -30,6 +254,11 @@ def read_sales_data(filename):
             print(f"Error: File '{filename}' not found.")
             return []
 
+        except DECOMPRESSION_ERRORS as e:
+            print(f"Error: Unable to decompress file '{filename}'.")
+            print("Error details:", str(e))
+            return []
+
     print("Error: Unable to read file with supported encodings.")
     return []
 
@@ -37,41 +266,18 @@ def read_sales_data(filename):
 def parse_transactions(raw_lines):
     """
     Parses raw lines into clean list of dictionaries
+
+    Rows with the wrong number of fields or unparseable numbers are skipped;
+    use check_data_quality() to see why.
     """
 
     transactions = []
 
     for line in raw_lines:
-        parts = line.split('|')
-
-        # Skip rows with incorrect number of fields
-        if len(parts) != 8:
-            continue
-
-        tid, date, pid, pname, qty, price, cid, region = parts
-
-        # Clean ProductName (remove commas)
-        pname = pname.replace(',', '')
-
-        try:
-            # Clean numeric fields
-            qty = int(qty.replace(',', ''))
-            price = float(price.replace(',', ''))
-        except ValueError:
-            continue
+        transaction, failed = parse_line(line)
 
-        transaction = {
-            'TransactionID': tid,
-            'Date': date,
-            'ProductID': pid,
-            'ProductName': pname,
-            'Quantity': qty,
-            'UnitPrice': price,
-            'CustomerID': cid,
-            'Region': region
-        }
-
-        transactions.append(transaction)
+        if transaction is not None and not failed:
+            transactions.append(transaction)
 
     return transactions
 
@@ -87,29 +293,22 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
     regions = set()
     amounts = []
 
+    invalid_by_rule = {name: 0 for name, _ in RECORD_RULES}
+
     # Validation phase
     for tx in transactions:
-        try:
-            if (
-                tx['Quantity'] <= 0 or
-                tx['UnitPrice'] <= 0 or
-                not tx['TransactionID'].startswith('T') or
-                not tx['ProductID'].startswith('P') or
-                not tx['CustomerID'].startswith('C') or
-                not tx['Region']
-            ):
-                invalid_count += 1
-                continue
-
-            amount = tx['Quantity'] * tx['UnitPrice']
-            tx['Amount'] = amount
-
-            regions.add(tx['Region'])
-            amounts.append(amount)
-            valid_transactions.append(tx)
-
-        except KeyError:
+        if not is_valid_record(tx):
             invalid_count += 1
+            for rule in failed_record_rules(tx):
+                invalid_by_rule[rule] += 1
+            continue
+
+        amount = tx['Quantity'] * tx['UnitPrice']
+        tx['Amount'] = amount
+
+        regions.add(tx['Region'])
+        amounts.append(amount)
+        valid_transactions.append(tx)
 
     # Display available filter options
     print("Available Regions:", regions)
@@ -143,6 +342,7 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
     summary = {
     'total_input': len(transactions),
     'invalid': invalid_count,
+    'invalid_by_rule': invalid_by_rule,
     'filtered_by_region': filtered_by_region,
     'filtered_by_amount': filtered_by_amount,
     'final_count': len(filtered),
@@ -0,0 +1,154 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+
+#Build baskets from transactions
+def build_baskets(transactions, by='customer'):
+    """
+    Groups products into baskets
+
+    by='customer' gives one basket per customer, by='day' one basket per
+    customer per date (a single shopping trip).
+
+    Returns: list of product sets
+    """
+    baskets = {}
+
+    for tx in transactions:
+        if by == 'customer':
+            key = tx['CustomerID']
+        elif by == 'day':
+            key = (tx['CustomerID'], tx['Date'])
+        else:
+            raise ValueError(f"Unknown basket grouping: {by}")
+
+        if key not in baskets:
+            baskets[key] = set()
+        baskets[key].add(tx['ProductName'])
+
+    return list(baskets.values())
+
+
+def count_items(baskets):
+    """
+    Counts in how many baskets each product appears
+    """
+    counts = Counter()
+    for basket in baskets:
+        counts.update(basket)
+    return counts
+
+
+def _chunks(items, size):
+    """
+    Splits a list into consecutive chunks of at most size items
+    """
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _count_encoded_pairs(baskets):
+    """
+    Counts pairs in baskets given as sorted tuples of product ids
+    """
+    counts = Counter()
+    for basket in baskets:
+        counts.update(combinations(basket, 2))
+    return counts
+
+
+def _worker_count(workers):
+    """
+    Number of processes to use; parallel counting only pays off with
+    more than one CPU, so this is 1 on single-core machines
+    """
+    if not workers or workers < 2:
+        return 1
+    return min(workers, os.cpu_count() or 1)
+
+
+#Product Affinity: support, confidence and lift
+def product_affinity(transactions, by='customer', min_support=0.05,
+                     min_confidence=0.0, workers=None, chunk_size=50000):
+    """
+    Mines product pairs that are bought together
+
+    min_support is the minimum share of baskets that must contain a pair
+    (and each of its products). Single products are counted in one pass;
+    baskets are then pruned to frequent products, encoded as integer ids
+    and their pairs counted in chunks of chunk_size. Set workers > 1 to
+    count the chunks in parallel processes (capped at the CPU count).
+
+    Returns: list of rule dictionaries
+    {'antecedent', 'consequent', 'pair_count', 'support', 'confidence', 'lift'}
+    sorted by lift descending
+    """
+    baskets = build_baskets(transactions, by)
+    total = len(baskets)
+
+    if not total:
+        return []
+
+    min_count = min_support * total
+
+    # Pass 1: frequent single products (cheap, done in this process)
+    item_counts = count_items(baskets)
+    frequent = sorted(
+        item for item, count in item_counts.items() if count >= min_count
+    )
+
+    # Apriori pruning: keep only frequent products, as ids in name order,
+    # and drop baskets that can no longer contain a pair
+    ids = {item: i for i, item in enumerate(frequent)}
+    encoded = []
+    for basket in baskets:
+        items = tuple(sorted(ids[item] for item in basket if item in ids))
+        if len(items) > 1:
+            encoded.append(items)
+
+    # Pass 2: pair counts; each chunk is sent to a worker exactly once
+    chunks = _chunks(encoded, chunk_size)
+    processes = _worker_count(workers)
+    pair_counts = Counter()
+
+    if processes > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for counts in executor.map(_count_encoded_pairs, chunks):
+                pair_counts.update(counts)
+    else:
+        for chunk in chunks:
+            pair_counts.update(_count_encoded_pairs(chunk))
+
+    pair_counts = {
+        (frequent[a], frequent[b]): count
+        for (a, b), count in pair_counts.items()
+    }
+
+    rules = []
+
+    for (a, b), count in pair_counts.items():
+        if count < min_count:
+            continue
+
+        support = count / total
+
+        for antecedent, consequent in ((a, b), (b, a)):
+            confidence = count / item_counts[antecedent]
+            if confidence < min_confidence:
+                continue
+
+            lift = confidence / (item_counts[consequent] / total)
+
+            rules.append({
+                'antecedent': antecedent,
+                'consequent': consequent,
+                'pair_count': count,
+                'support': round(support, 4),
+                'confidence': round(confidence, 4),
+                'lift': round(lift, 4)
+            })
+
+    rules.sort(key=lambda x: (x['lift'], x['support']), reverse=True)
+
+    return rules
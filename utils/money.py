@@ -0,0 +1,78 @@
+from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
+
+# Prices are held as integer paise (1/100 rupee) in exact money mode
+MINOR_UNITS = 100
+
+
+def to_minor_units(text):
+    """
+    Converts a price string such as '1,916' or '173.5' to integer paise
+    without going through float
+
+    Raises ValueError for text that is not a number.
+    """
+    text = text.replace(',', '')
+    if text.isdigit():
+        return int(text) * MINOR_UNITS
+
+    text = text.strip()
+    whole, dot, frac = text.partition('.')
+
+    # Fast path: plain integers or up to 2 decimals
+    if whole.lstrip('+-').isdigit() and len(frac) <= 2 and (not frac or frac.isdigit()):
+        fraction = int(frac.ljust(2, '0')) if frac else 0
+        if whole.startswith('-'):
+            fraction = -fraction
+        return int(whole) * MINOR_UNITS + fraction
+
+    # Rare cases (more than 2 decimals, exponents, '.5'): round via Decimal
+    try:
+        value = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Invalid price: {text!r}")
+
+    if not value.is_finite():
+        raise ValueError(f"Invalid price: {text!r}")
+
+    return int((value * MINOR_UNITS).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def parse_price(text):
+    """
+    Parses a price string such as '1,234.56' once into (rupees, paise)
+
+    The float is parsed as before; paise are derived from it and only
+    re-parsed exactly (to_minor_units) when the text has more than 2
+    decimals, so the usual price costs one float() and a round().
+
+    Raises ValueError for text that is not a finite number.
+    """
+    value = float(text.replace(',', ''))
+    try:
+        paise = round(value * MINOR_UNITS)
+    except OverflowError:
+        raise ValueError(f"Invalid price: {text!r}")
+
+    # Exact for up to 2 decimals: value is then the float nearest paise / 100
+    if paise / MINOR_UNITS != value:
+        paise = to_minor_units(text)
+
+    return value, paise
+
+
+def to_display(paise):
+    """
+    Converts integer paise to an exact Decimal rupee value for reporting
+    """
+    return Decimal(paise).scaleb(-2)
+
+
+def percentage(part, total):
+    """
+    Percentage of part in total rounded to 2 decimals, exact for integer inputs
+    """
+    if not total:
+        return 0.0
+    return float((Decimal(part) * 100 / Decimal(total)).quantize(
+        Decimal('0.01'), rounding=ROUND_HALF_UP
+    ))
@@ -10,28 +10,39 @@ from utils.data_processor import (
     find_peak_sales_day,
     low_performing_products
 )
+from utils.anomaly_detection import detect_anomalies
 
 
-def generate_sales_report(transactions, enriched_transactions, output_file='output/sales_report.txt'):
+def generate_sales_report(transactions, enriched_transactions, output_file='output/sales_report.txt',
+                          exact=False, anomaly_scopes=(None, 'region')):
     """
     Generates a comprehensive formatted text report
+
+    exact=True totals money in integer paise, converting only for display.
+    anomaly_scopes lists the detect_anomalies groupings to report
+    (None = overall); add 'product' for per-product anomalies.
     """
 
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     total_records = len(transactions)
 
-    total_revenue = calculate_total_revenue(transactions)
+    total_revenue = calculate_total_revenue(transactions, exact=exact)
     avg_order_value = total_revenue / total_records if total_records else 0
 
     dates = sorted(tx['Date'] for tx in transactions)
     date_range = f"{dates[0]} to {dates[-1]}" if dates else "N/A"
 
-    region_data = region_wise_sales(transactions)
-    top_products = top_selling_products(transactions, 5)
-    customers = customer_analysis(transactions)
-    daily_trend = daily_sales_trend(transactions)
-    peak_day = find_peak_sales_day(transactions)
-    low_products = low_performing_products(transactions)
+    region_data = region_wise_sales(transactions, exact=exact)
+    top_products = top_selling_products(transactions, 5, exact=exact)
+    customers = customer_analysis(transactions, exact=exact)
+    daily_trend = daily_sales_trend(transactions, exact=exact)
+    peak_day = find_peak_sales_day(transactions, exact=exact)
+    low_products = low_performing_products(transactions, exact=exact)
+    anomalies = [
+        anomaly
+        for by in anomaly_scopes
+        for anomaly in detect_anomalies(transactions, by=by, exact=exact)
+    ]
 
     enriched_success = [tx for tx in enriched_transactions if tx.get('API_Match')]
     enriched_failed = [tx['ProductName'] for tx in enriched_transactions if not tx.get('API_Match')]
@@ -114,7 +125,27 @@ def generate_sales_report(transactions, enriched_transactions, output_file='outp
             f.write("No low performing products identified.\n")
         f.write("\n")
 
-        # 8. API ENRICHMENT SUMMARY
+        # 8. REVENUE ANOMALIES
+        f.write("REVENUE ANOMALIES\n")
+        f.write("-" * 50 + "\n")
+
+        if anomalies:
+            f.write(f"{'Date':<12}{'Scope':<25}{'Revenue':<15}{'Expected':<15}{'Score'}\n")
+            for anomaly in anomalies:
+                if anomaly['group'] is None:
+                    scope = 'Overall'
+                else:
+                    scope = f"{anomaly['scope'].title()}: {anomaly['group']}"
+                f.write(
+                    f"{anomaly['date']:<12}{scope:<25}"
+                    f"₹{anomaly['revenue']:<14,.0f}₹{anomaly['expected']:<14,.0f}"
+                    f"{anomaly['score']} ({', '.join(anomaly['methods'])})\n"
+                )
+        else:
+            f.write("No revenue anomalies detected.\n")
+        f.write("\n")
+
+        # 9. API ENRICHMENT SUMMARY
         f.write("API ENRICHMENT SUMMARY\n")
         f.write("-" * 50 + "\n")
         f.write(f"Total Transactions:     {len(enriched_transactions)}\n")